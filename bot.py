@@ -2,22 +2,35 @@
 """Railway-ready Twitter News Bot service."""
 
 import asyncio
-import json
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import io
+import itertools
 import logging
+import multiprocessing
 import os
+import re
 import subprocess
 import tempfile
 import textwrap
 import shutil
+import time
+import types
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, TypeVar
 
-import requests
+import aiohttp
+import orjson
 import tweepy  # type: ignore
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from openai import OpenAI, OpenAIError
 from pydantic import BaseModel, Field
 from PIL import Image, ImageDraw, ImageFont
@@ -28,9 +41,6 @@ try:
 except ImportError:  # pragma: no cover
     launch = None  # type: ignore
 
-# Load environment variables from .env file
-load_dotenv()
-
 logger = logging.getLogger("twitter_news_bot")
 if not logger.handlers:
     handler = logging.StreamHandler()
@@ -40,13 +50,553 @@ if not logger.handlers:
     )
     handler.setFormatter(formatter)
     logger.addHandler(handler)
-logger.setLevel(logging.DEBUG)
+
+
+def _apply_log_level() -> None:
+    # Debug output formats large payloads on every run, so it is opt-in
+    level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), None)
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+
+
+_apply_log_level()
+
+
+def _bootstrap() -> None:
+    """Load environment variables from the .env file for a serving process."""
+    load_dotenv()
+    _apply_log_level()
+
+
+# Pillow rendering is CPU-bound, so it runs in worker processes to keep the
+# event loop responsive and sidestep the GIL.
+_IMAGE_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _get_image_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _IMAGE_POOL
+    if _IMAGE_POOL is None:
+        max_workers = int(os.getenv("IMAGE_WORKERS", str(os.cpu_count() or 1)))
+        logger.debug("Starting image process pool with %s workers", max_workers)
+        # Forking a server process with a running loop, helper threads and open
+        # sockets/Chromium pipes is unsafe, so children start from a clean process
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _IMAGE_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context(start_method)
+        )
+    return _IMAGE_POOL
+
+
+T = TypeVar("T")
+
+# A news card normally renders well within this; past it the screenshot is
+# started as a hedge in "both" mode
+_AI_IMAGE_HEDGE_DELAY = 5.0
+
+# News changes slowly relative to how often /run may be hit, so upstream
+# results are shared for a minute across bot instances in this worker.
+_NEWS_CACHE: "TTLCache[Tuple[str, ...], List[Dict[str, str]]]" = TTLCache(maxsize=8, ttl=60)
+_NEWS_LOCKS: Dict[Tuple[str, ...], asyncio.Lock] = collections.defaultdict(asyncio.Lock)
+
+
+async def _prefer_primary(
+    primary: Awaitable[T],
+    fallback: Callable[[], Awaitable[T]],
+    description: str,
+    *,
+    hedge_delay: Optional[float] = 0,
+    on_discard: Optional[Callable[[T], None]] = None,
+) -> T:
+    """Return the primary's result if usable, otherwise the fallback's.
+
+    ``fallback`` is a factory so it only starts when needed: straight away
+    with the default ``hedge_delay`` of 0 (a failing primary then costs the
+    slower of the two calls rather than their sum), after ``hedge_delay``
+    seconds if the primary is still running, or, with ``None``, only once
+    the primary has failed. A task whose result is no longer needed is
+    cancelled; a finished result that goes unused is passed to
+    ``on_discard`` so side effects such as written files can be undone.
+    """
+    primary_task = asyncio.ensure_future(primary)
+    fallback_task: Optional["asyncio.Future[T]"] = None
+    winner: Optional["asyncio.Future[T]"] = None
+    try:
+        if hedge_delay != 0:
+            await asyncio.wait({primary_task}, timeout=hedge_delay)
+        if not primary_task.done():
+            fallback_task = asyncio.ensure_future(fallback())
+        try:
+            result = await primary_task
+        except Exception as exc:
+            logger.warning("%s failed, using fallback: %s", description, exc)
+        else:
+            if result:
+                winner = primary_task
+                return result
+            logger.warning("%s returned no results, using fallback", description)
+        if fallback_task is None:
+            fallback_task = asyncio.ensure_future(fallback())
+        winner = fallback_task
+        return await fallback_task
+    finally:
+        for task in (primary_task, fallback_task):
+            if task is None or task is winner:
+                continue
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled() and task.exception() is None:
+                unused = task.result()
+                if unused and on_discard is not None:
+                    on_discard(unused)
+
+
+@functools.lru_cache(maxsize=None)
+def _temp_dir() -> Path:
+    """Scratch directory for generated media, created once per process."""
+    temp_dir = Path(tempfile.gettempdir()) / "twitter_bot"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    return temp_dir
+
+
+# Twitter's weighted length (twitter-text v3 config): code points in these
+# ranges count once, everything else, emoji included, counts twice.
+_TWEET_DOUBLE_WEIGHT_RE = re.compile("[^\u0000-\u10ff\u2000-\u200d\u2010-\u201f\u2032-\u2037]")
+
+
+# Links are wrapped by t.co and always count as this many characters
+_TWEET_URL_LENGTH = 23
+
+
+def _tweet_length(text: str) -> int:
+    """Length of ``text`` as counted against Twitter's 280 limit."""
+    return len(text) + len(_TWEET_DOUBLE_WEIGHT_RE.findall(text))
+
+
+def _truncate_tweet(text: str, limit: int) -> str:
+    """Shorten ``text`` to ``limit`` weighted characters, ending a cut with '...'."""
+    if _tweet_length(text) <= limit:
+        return text
+    budget = limit - 3
+    used = 0
+    for index, char in enumerate(text):
+        used += 2 if _TWEET_DOUBLE_WEIGHT_RE.match(char) else 1
+        if used > budget:
+            return text[:index] + "..."
+    return text
+
+
+# Sparklines move over minutes, so a downloaded chart is reused for a while.
+# The file mtime is the cache timestamp, which lets every worker share it.
+_CHART_TTL = 300
+# Head start the direct chart download gets before a browser capture is tried
+_CHART_HEDGE_DELAY = 2.0
+# Downloads are streamed to disk and abandoned past a sane size for a sparkline
+_CHART_CHUNK_SIZE = 64 * 1024
+_CHART_MAX_BYTES = 5_000_000
+_SYMBOL_TO_COINGECKO = types.MappingProxyType({
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "SOL": "solana",
+    "XRP": "ripple",
+    "ADA": "cardano",
+    "DOT": "polkadot",
+    "MATIC": "matic-network",
+    "LINK": "chainlink",
+    "UNI": "uniswap",
+    "AVAX": "avalanche-2",
+})
+
+
+def _chart_cache_path(symbol: str) -> Path:
+    return _temp_dir() / f"chart_{symbol.upper()}.png"
+
+
+# Files a crashed or cancelled run may have left behind in the scratch directory
+_MEDIA_PATTERNS = ("chart_*", "screenshot_*", "news_overlay_*")
+
+
+def _purge_stale_media() -> None:
+    """Remove generated files that have not been touched for several chart TTLs."""
+    cutoff = time.time() - _CHART_TTL * 4
+    for pattern in _MEDIA_PATTERNS:
+        for path in _temp_dir().glob(pattern):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Transient failures on idempotent GETs are retried with exponential
+# backoff: one attempt plus two retries.
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+async def _with_retries(request: Callable[[], Awaitable[T]], description: str) -> T:
+    """Run an idempotent request, retrying on connection errors, timeouts and
+    throttling/server-error statuses (raised as ClientResponseError)."""
+    attempt = 0
+    while True:
+        try:
+            return await request()
+        except (aiohttp.ClientConnectionError, aiohttp.ClientResponseError, asyncio.TimeoutError) as exc:
+            if isinstance(exc, aiohttp.ClientResponseError) and exc.status not in _RETRY_STATUSES:
+                raise
+            attempt += 1
+            if attempt >= _RETRY_ATTEMPTS:
+                raise
+            delay = _RETRY_BACKOFF * (2 ** (attempt - 1))
+            logger.debug("%s failed (%s); retrying in %.1fs", description, exc, delay)
+            await asyncio.sleep(delay)
+
+
+# Resized template backgrounds keyed by (path, size) -> (mtime, image), so
+# repeated renders in a worker process skip the decode and LANCZOS resize.
+_BACKGROUND_CACHE: Dict[Tuple[str, Tuple[int, int]], Tuple[float, Image.Image]] = {}
+
+
+# ----------------------------------------------------------------------
+# Font helpers (cached per process)
+# ----------------------------------------------------------------------
+
+_FONT_PATHS: Dict[str, List[str]] = {
+    "Inter": [
+        "/System/Library/Fonts/Supplemental/Arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    ],
+    "Montserrat": [
+        "/System/Library/Fonts/Supplemental/Arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ],
+    "Roboto": [
+        "/System/Library/Fonts/Supplemental/Arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ],
+    "HelveticaNeue": [
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/System/Library/Fonts/Supplemental/Arial.ttf",
+    ],
+}
+
+_FONTCONFIG_FAMILIES: Dict[str, str] = {
+    "Inter": "Inter",
+    "Montserrat": "Montserrat",
+    "Roboto": "Roboto",
+    "HelveticaNeue": "Helvetica Neue",
+}
+
+
+def _fontconfig_match(family: str, bold: bool) -> Optional[str]:
+    """Locate a font file via fontconfig, common on Linux containers."""
+    pattern = f"{family}:style=Bold" if bold else family
+    try:
+        result = subprocess.run(
+            ["fc-match", "-f", "%{file}\n", pattern],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        font_path = result.stdout.strip()
+        if font_path and Path(font_path).exists():
+            logger.debug("Resolved font via fontconfig: %s (%s)", font_path, pattern)
+            return font_path
+    except Exception as exc:
+        logger.debug("fontconfig lookup failed for %s: %s", pattern, exc)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_font_path(font_name: str, bold: bool) -> Optional[str]:
+    """Find the font file for a family/weight once per process."""
+    paths = _FONT_PATHS.get(font_name, _FONT_PATHS["Inter"])
+    if bold:
+        paths = [p.replace(".ttf", "-Bold.ttf").replace(".ttc", "-Bold.ttc") for p in paths] + paths
+
+    for path in paths:
+        if Path(path).exists():
+            return path
+
+    families = [_FONTCONFIG_FAMILIES[font_name]] if font_name in _FONTCONFIG_FAMILIES else []
+    # Try generic fallbacks
+    families += ["DejaVu Sans", "Arial", "Liberation Sans"]
+    for family in families:
+        font_path = _fontconfig_match(family, bold)
+        if font_path:
+            return font_path
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_font(font_name: str, size: int, bold: bool) -> ImageFont.FreeTypeFont:
+    """Load (and memoize) a FreeType face for the given family, size and weight."""
+    font_path = _resolve_font_path(font_name, bold)
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception as exc:
+            logger.debug("Failed to load font %s: %s", font_path, exc)
+
+    # Fallback to default font
+    try:
+        return ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+# ----------------------------------------------------------------------
+# Headless browser pool
+# ----------------------------------------------------------------------
+
+class _BrowserPool:
+    """Headless Chromium shared by every bot in this worker process.
+
+    Launching Chromium costs seconds, so the browser is started once. Pages
+    are kept warm per viewport size and handed out with ``checkout_page`` /
+    ``checkin_page``, so a screenshot usually only has to navigate.
+    """
+
+    MAX_IDLE_PAGES = 2
+
+    LAUNCH_ARGS = [
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--no-zygote",
+        "--hide-scrollbars",
+        "--disable-extensions",
+        "--window-size=1200,800",
+    ]
+
+    def __init__(self) -> None:
+        self._browser: Optional[Any] = None
+        self._lock = asyncio.Lock()
+        self._launching: Optional["asyncio.Future[Any]"] = None
+        self._idle_pages: Dict[Tuple[int, int], List[Any]] = collections.defaultdict(list)
+        # Resource types each page currently aborts; read by its request handler
+        self._blocked_types: Dict[Any, FrozenSet[str]] = {}
+
+    async def get_browser(self) -> Optional[Any]:
+        """Return the shared browser, launching (or relaunching) it as needed."""
+        if launch is None:
+            logger.warning("pyppeteer is not installed; skipping screenshot generation")
+            return None
+
+        async with self._lock:
+            if self._browser is not None:
+                # returncode is only refreshed by poll(); pyppeteer never calls it
+                if self._browser.process.poll() is None:
+                    return self._browser
+                logger.warning("Chromium exited (code %s); relaunching", self._browser.process.returncode)
+                self._browser = None
+
+            if self._launching is None:
+                executable_path = (
+                    os.environ.get("CHROMIUM_PATH")
+                    or shutil.which("chromium")
+                    or shutil.which("chromium-browser")
+                    or shutil.which("google-chrome")
+                    or shutil.which("google-chrome-stable")
+                )
+
+                if not executable_path:
+                    logger.error(
+                        "Chromium executable not found. Set CHROMIUM_PATH environment variable "
+                        "or ensure chromium is available on PATH."
+                    )
+                    return None
+
+                logger.debug("Launching headless browser using Chromium executable at: %s", executable_path)
+                # Pages from a previous (crashed) browser cannot be reused
+                self._idle_pages.clear()
+                self._blocked_types.clear()
+                self._launching = asyncio.ensure_future(
+                    launch(
+                        headless=True,
+                        args=self.LAUNCH_ARGS,
+                        handleSIGINT=False,
+                        handleSIGTERM=False,
+                        handleSIGHUP=False,
+                        executablePath=executable_path,
+                    )
+                )
+                self._launching.add_done_callback(self._adopt_browser)
+            # Shielded: a capture cancelled mid-launch must not orphan the
+            # Chromium process; the pool adopts it when the launch completes
+            return await asyncio.shield(self._launching)
+
+    def _adopt_browser(self, launching: "asyncio.Future[Any]") -> None:
+        self._launching = None
+        if launching.cancelled():
+            return
+        if launching.exception() is None:
+            browser = launching.result()
+            browser.on("disconnected", lambda: self._forget_browser(browser))
+            self._browser = browser
+
+    def _forget_browser(self, browser: Any) -> None:
+        if self._browser is browser:
+            logger.warning("Lost connection to Chromium; it will be relaunched on next use")
+            self._browser = None
+
+    async def _discard_browser(self, browser: Any) -> None:
+        """Drop a browser that stopped responding so the next capture relaunches it."""
+        async with self._lock:
+            if self._browser is browser:
+                self._browser = None
+                self._idle_pages.clear()
+                self._blocked_types.clear()
+        try:
+            await asyncio.wait_for(browser.close(), timeout=5)
+        except Exception as exc:
+            logger.debug("Failed to close unresponsive browser: %s", exc)
+            if browser.process.poll() is None:
+                browser.process.kill()
+
+    async def checkout_page(
+        self, width: int, height: int, blocked_types: FrozenSet[str], javascript: bool = True
+    ) -> Optional[Any]:
+        """Return a page with the given viewport, reusing an idle one if possible."""
+        browser = await self.get_browser()
+        if browser is None:
+            return None
+
+        page = None
+        idle = self._idle_pages[(width, height)]
+        while idle:
+            candidate = idle.pop()
+            if not candidate.isClosed():
+                page = candidate
+                break
+            self._blocked_types.pop(candidate, None)
+
+        # Any failure or cancellation from here on must not leak the tab: the
+        # caller only learns about the page once it is returned
+        try:
+            if page is None:
+                try:
+                    page = await self._open_page(browser)
+                except Exception as exc:
+                    # A browser that cannot open tabs is wedged or gone
+                    logger.warning("Opening a Chromium tab failed, relaunching the browser: %s", exc)
+                    await self._discard_browser(browser)
+                    browser = await self.get_browser()
+                    if browser is None:
+                        return None
+                    page = await self._open_page(browser)
+                await page.setViewport({"width": width, "height": height, "deviceScaleFactor": 1})
+                # Set user agent to avoid bot detection
+                await page.setUserAgent(_USER_AGENT)
+                page.setDefaultNavigationTimeout(10000)
+                await page.setRequestInterception(True)
+                page.on(
+                    "request",
+                    lambda request, page=page: asyncio.ensure_future(self._intercept(page, request)),
+                )
+            self._blocked_types[page] = blocked_types
+            await page.setJavaScriptEnabled(javascript)
+        except BaseException:
+            if page is not None:
+                await self._close_page(page)
+            raise
+        return page
+
+    async def _open_page(self, browser: Any) -> Any:
+        creating = asyncio.ensure_future(browser.newPage())
+        try:
+            return await asyncio.shield(creating)
+        except asyncio.CancelledError:
+            # The tab is still being created; close it once it exists
+            creating.add_done_callback(self._discard_new_page)
+            raise
+
+    async def checkin_page(self, page: Any, width: int, height: int, reusable: bool) -> None:
+        """Keep ``page`` for the next capture, or close it if it is not reusable."""
+        idle = self._idle_pages[(width, height)]
+        if reusable and len(idle) < self.MAX_IDLE_PAGES and not page.isClosed():
+            try:
+                await page.evaluate("() => window.stop()")
+                await page._client.send("Network.clearBrowserCookies")
+            except Exception as exc:
+                logger.debug("Failed to reset screenshot page: %s", exc)
+            except BaseException:
+                await self._close_page(page)
+                raise
+            else:
+                idle.append(page)
+                return
+        await self._close_page(page)
+
+    def _discard_new_page(self, creating: "asyncio.Future[Any]") -> None:
+        if not creating.cancelled() and creating.exception() is None:
+            asyncio.ensure_future(self._close_page(creating.result()))
+
+    async def _close_page(self, page: Any) -> None:
+        self._blocked_types.pop(page, None)
+        try:
+            await page.close()
+        except Exception as exc:  # pragma: no cover
+            logger.debug("Failed to close screenshot page: %s", exc)
+
+    async def _intercept(self, page: Any, request: Any) -> None:
+        """Abort downloads that do not affect the screenshot."""
+        try:
+            blocked_types = self._blocked_types.get(page, _BLOCKED_RESOURCE_TYPES)
+            if request.resourceType in blocked_types or _TRACKER_RE.search(request.url):
+                await request.abort()
+            else:
+                await request.continue_()
+        except Exception as exc:
+            logger.debug("Request interception failed for %s: %s", request.url, exc)
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._launching is not None:
+                # Let an in-flight launch finish so its browser is closed below
+                try:
+                    await self._launching
+                except Exception as exc:  # pragma: no cover
+                    logger.debug("Browser launch failed during shutdown: %s", exc)
+            for pages in self._idle_pages.values():
+                for page in pages:
+                    await self._close_page(page)
+            self._idle_pages.clear()
+            self._blocked_types.clear()
+            if self._browser is None:
+                return
+            try:
+                await self._browser.close()
+                logger.debug("Browser closed")
+            except Exception as exc:  # pragma: no cover
+                logger.debug("Failed to close browser: %s", exc)
+            self._browser = None
+
+
+_BROWSER_POOL = _BrowserPool()
+
+# Upper bound for a whole capture (navigation, selector waits, screenshot)
+_SCREENSHOT_TIMEOUT = 60
+
+# Requests aborted during captures: resource types that never show up in a
+# static screenshot, plus common analytics/ad trackers
+_BLOCKED_RESOURCE_TYPES = frozenset({"media", "font", "websocket", "eventsource", "manifest"})
+_TRACKER_RE = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|cdn\.segment\.com"
+    r"|api\.segment\.io|hotjar\.com|mixpanel\.com"
+)
 
 
 class TwitterNewsBot:
     """Python adaptation of the TypeScript twitter-news-bot."""
 
-    CRYPTO_SYMBOLS = [
+    # Tuples rather than sets: screenshot targeting scans these in priority order
+    CRYPTO_SYMBOLS = (
         "BTC",
         "ETH",
         "SOL",
@@ -57,9 +607,36 @@ class TwitterNewsBot:
         "LINK",
         "UNI",
         "AVAX",
-    ]
+    )
+
+    COINGECKO_IDS = ("bitcoin", "ethereum", "solana", "ripple", "cardano")
+    # Plain substring matching against casefolded text; the lookahead reports
+    # overlapping hits
+    _SYMBOL_RE = re.compile("(?=(" + "|".join(re.escape(s.casefold()) for s in CRYPTO_SYMBOLS) + "))")
+    _COINGECKO_RE = re.compile("(?=(" + "|".join(re.escape(s.casefold()) for s in COINGECKO_IDS) + "))")
+    # Common crypto hashtags, keyed by the uppercase keyword that triggers them
+    CRYPTO_KEYWORDS: Dict[str, str] = {
+        "BITCOIN": "#Bitcoin", "BTC": "#Bitcoin",
+        "ETHEREUM": "#Ethereum", "ETH": "#Ethereum",
+        "SOLANA": "#Solana", "SOL": "#Solana",
+        "ZCASH": "#Zcash", "ZEC": "#Zcash",
+        "FIRO": "#Firo",
+        "MONERO": "#Monero", "XMR": "#Monero",
+        "NEAR": "#NEAR", "NEAR PROTOCOL": "#NEAR",
+        "UNISWAP": "#Uniswap", "UNI": "#Uniswap",
+        "NFT": "#NFTs", "NFTS": "#NFTs", "PENGUIN": "#NFTs", "PENGUINS": "#NFTs",
+        "WEB3": "#Web3",
+    }
+    # Longest keywords first so multi-word entries win over their prefixes
+    _KEYWORD_RE = re.compile(
+        r"\b(" + "|".join(map(re.escape, sorted(CRYPTO_KEYWORDS, key=len, reverse=True))) + r")\b"
+    )
+
+    AI_IMAGE_CACHE_SIZE = 8
+
+    _PREFIX = "📰 "
+    _BULLET = "▸ "
 
-    COINGECKO_IDS = ["bitcoin", "ethereum", "solana", "ripple", "cardano"]
     CREDENTIAL_KEYS = [
         "twitter_api_key",
         "twitter_api_secret",
@@ -72,16 +649,37 @@ class TwitterNewsBot:
         self.twitter_client: Optional[tweepy.Client] = None
         self.twitter_api: Optional[tweepy.API] = None
         self.openai_client: Optional[OpenAI] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._tmpdir = _temp_dir()
+        # Rendered cards keyed by (headline, key points), least recently used first
+        self._ai_image_cache: "collections.OrderedDict[Tuple[str, Tuple[str, ...]], str]" = (
+            collections.OrderedDict()
+        )
 
         self.apply_config(config, reset_credentials=True)
         logger.debug("TwitterNewsBot initialised successfully")
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Only configuration is sent to image worker processes; API clients
+        # and sessions are not picklable and are not needed for rendering.
+        return {"config": dict(self.config)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.config = state["config"]
+        self.twitter_client = None
+        self.twitter_api = None
+        self.openai_client = None
+        self._session = None
+        self._tmpdir = _temp_dir()
+        self._ai_image_cache = collections.OrderedDict()
+
     def apply_config(self, config: Dict[str, Any], *, reset_credentials: bool = False) -> None:
         """Merge new configuration values and optionally refresh API clients."""
         if not config:
             return
 
-        logger.debug("Applying configuration update with keys: %s", list(config.keys()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Applying configuration update with keys: %s", list(config.keys()))
 
         # Update stored config (ignore None to preserve previous explicit values)
         filtered_config = {key: value for key, value in config.items() if value is not None}
@@ -114,115 +712,203 @@ class TwitterNewsBot:
 
         self.openai_client = OpenAI(api_key=self.config["openai_api_key"])
 
+    # ------------------------------------------------------------------
+    # HTTP session helpers
+    # ------------------------------------------------------------------
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=60),
+                headers={"User-Agent": _USER_AGENT},
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Release network resources held by the bot."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     # ------------------------------------------------------------------
     # News fetching helpers
     # ------------------------------------------------------------------
-    def fetch_crypto_news(self) -> List[Dict[str, str]]:
-        items: List[Dict[str, str]] = []
+    async def _cached_news(
+        self, key: Tuple[str, ...], fetch: Callable[[], Awaitable[List[Dict[str, str]]]]
+    ) -> List[Dict[str, str]]:
+        """Serve news from the TTL cache, coalescing concurrent misses into one fetch."""
+        items = _NEWS_CACHE.get(key)
+        if items is None:
+            async with _NEWS_LOCKS[key]:
+                # Another caller may have filled the cache while we waited
+                items = _NEWS_CACHE.get(key)
+                if items is None:
+                    items = await fetch()
+                    if items:
+                        _NEWS_CACHE[key] = items
+        else:
+            logger.debug("Serving %s news from cache", key[0])
+        return list(items)
+
+    async def fetch_crypto_news(self) -> List[Dict[str, str]]:
+        return await self._cached_news(("crypto",), self._fetch_crypto_news_impl)
+
+    async def _fetch_crypto_news_impl(self) -> List[Dict[str, str]]:
         logger.debug("Fetching crypto news")
+        session = await self._get_session()
         try:
-            response = requests.get(
-                "https://cryptopanic.com/api/v1/posts/",
-                params={"auth_token": "free", "kind": "news", "filter": "important"},
-                timeout=10,
+            # CoinGecko is requested alongside CryptoPanic so a slow or failing
+            # primary does not delay the fallback by a full timeout
+            items = await _prefer_primary(
+                self._fetch_cryptopanic(session),
+                functools.partial(self._fetch_coingecko_trending, session),
+                "Crypto news fetch via CryptoPanic",
             )
-            response.raise_for_status()
-            payload = response.json()
-            logger.debug("Received %s crypto items from CryptoPanic", len(payload.get("results", [])))
-            for entry in payload.get("results", [])[:5]:
-                items.append(
-                    {
-                        "title": entry["title"],
-                        "description": entry["title"],
-                        "url": entry["url"],
-                        "published_at": entry["published_at"],
-                        "source": entry["source"]["title"],
-                    }
-                )
-        except Exception as exc:  # pragma: no cover - network fallback
-            logger.warning("Crypto news fetch failed, falling back to CoinGecko: %s", exc)
-            try:
-                response = requests.get(
-                    "https://api.coingecko.com/api/v3/search/trending", timeout=10
-                )
-                response.raise_for_status()
-                fallback_payload = response.json()
-                logger.debug("CoinGecko trending returned %s coins", len(fallback_payload.get("coins", [])))
-                for coin in fallback_payload.get("coins", [])[:5]:
-                    item = coin["item"]
-                    items.append(
-                        {
-                            "title": f"{item['name']} ({item['symbol']}) is trending",
-                            "description": f"Market Cap Rank: #{item['market_cap_rank']}",
-                            "url": f"https://www.coingecko.com/en/coins/{item['id']}",
-                            "published_at": datetime.utcnow().isoformat(),
-                            "source": "CoinGecko",
-                        }
-                    )
-            except Exception as fallback_error:  # pragma: no cover
-                logger.error("Fallback crypto news failed: %s", fallback_error)
+        except Exception as exc:  # pragma: no cover
+            logger.error("Fallback crypto news failed: %s", exc)
+            items = []
         logger.debug("Returning %s crypto news items", len(items))
         return items
 
-    def fetch_world_news(self) -> List[Dict[str, str]]:
+    async def _get_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        description: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """GET ``url`` and decode its JSON body, retrying transient failures."""
+
+        async def fetch() -> Any:
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+
+        return await _with_retries(fetch, description)
+
+    async def _fetch_cryptopanic(self, session: aiohttp.ClientSession) -> List[Dict[str, str]]:
+        payload = await self._get_json(
+            session,
+            "https://cryptopanic.com/api/v1/posts/",
+            "CryptoPanic fetch",
+            params={"auth_token": "free", "kind": "news", "filter": "important"},
+        )
+        logger.debug("Received %s crypto items from CryptoPanic", len(payload.get("results", [])))
+        return [
+            {
+                "title": entry["title"],
+                "description": entry["title"],
+                "url": entry["url"],
+                "published_at": entry["published_at"],
+                "source": entry["source"]["title"],
+            }
+            for entry in payload.get("results", [])[:5]
+        ]
+
+    async def _fetch_coingecko_trending(self, session: aiohttp.ClientSession) -> List[Dict[str, str]]:
+        payload = await self._get_json(
+            session, "https://api.coingecko.com/api/v3/search/trending", "CoinGecko trending fetch"
+        )
+        logger.debug("CoinGecko trending returned %s coins", len(payload.get("coins", [])))
         items: List[Dict[str, str]] = []
+        for coin in payload.get("coins", [])[:5]:
+            item = coin["item"]
+            items.append(
+                {
+                    "title": f"{item['name']} ({item['symbol']}) is trending",
+                    "description": f"Market Cap Rank: #{item['market_cap_rank']}",
+                    "url": f"https://www.coingecko.com/en/coins/{item['id']}",
+                    "published_at": datetime.utcnow().isoformat(),
+                    "source": "CoinGecko",
+                }
+            )
+        return items
+
+    async def fetch_world_news(self) -> List[Dict[str, str]]:
+        api_key = self.config.get("news_api_key") or ""
+        return await self._cached_news(("world", api_key), self._fetch_world_news_impl)
+
+    async def _fetch_world_news_impl(self) -> List[Dict[str, str]]:
+        session = await self._get_session()
         api_key = self.config.get("news_api_key")
-        if api_key and api_key != "demo":
-            logger.debug("Fetching world news via NewsAPI")
-            try:
-                response = requests.get(
-                    "https://newsapi.org/v2/top-headlines",
-                    params={
-                        "apiKey": api_key,
-                        "category": "technology",
-                        "language": "en",
-                        "pageSize": 5,
-                    },
-                    timeout=10,
+        try:
+            if api_key and api_key != "demo":
+                logger.debug("Fetching world news via NewsAPI with HackerNews fallback")
+                items = await _prefer_primary(
+                    self._fetch_newsapi(session, api_key),
+                    functools.partial(self._fetch_hackernews, session),
+                    "World news fetch via NewsAPI",
                 )
-                response.raise_for_status()
-                articles_payload = response.json()
-                logger.debug("NewsAPI returned %s articles", len(articles_payload.get("articles", [])))
-                for article in articles_payload.get("articles", [])[:5]:
-                    items.append(
-                        {
-                            "title": article.get("title"),
-                            "description": article.get("description") or article.get("title"),
-                            "url": article.get("url"),
-                            "published_at": article.get("publishedAt"),
-                            "source": article.get("source", {}).get("name", "News"),
-                        }
-                    )
-            except Exception as exc:  # pragma: no cover - fallback path
-                logger.warning("World news fetch via NewsAPI failed: %s", exc)
-
-        if not items:
-            logger.debug("Falling back to HackerNews for world news")
-            try:
-                top_ids = requests.get(
-                    "https://hacker-news.firebaseio.com/v0/topstories.json", timeout=10
-                ).json()[:5]
-                logger.debug("HackerNews top stories IDs: %s", top_ids)
-                for story_id in top_ids:
-                    story = requests.get(
-                        f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json",
-                        timeout=10,
-                    ).json()
-                    items.append(
-                        {
-                            "title": story.get("title", ""),
-                            "description": story.get("title", ""),
-                            "url": story.get("url")
-                            or f"https://news.ycombinator.com/item?id={story_id}",
-                            "published_at": datetime.utcfromtimestamp(story.get("time", 0)).isoformat(),
-                            "source": "HackerNews",
-                        }
-                    )
-            except Exception as exc:  # pragma: no cover
-                logger.error("Fallback world news failed: %s", exc)
+            else:
+                items = await self._fetch_hackernews(session)
+        except Exception as exc:  # pragma: no cover
+            logger.error("Fallback world news failed: %s", exc)
+            items = []
         logger.debug("Returning %s world news items", len(items))
         return items
 
+    async def _fetch_newsapi(self, session: aiohttp.ClientSession, api_key: str) -> List[Dict[str, str]]:
+        payload = await self._get_json(
+            session,
+            "https://newsapi.org/v2/top-headlines",
+            "NewsAPI fetch",
+            params={
+                "apiKey": api_key,
+                "category": "technology",
+                "language": "en",
+                "pageSize": 5,
+            },
+        )
+        logger.debug("NewsAPI returned %s articles", len(payload.get("articles", [])))
+        return [
+            {
+                "title": article.get("title"),
+                "description": article.get("description") or article.get("title"),
+                "url": article.get("url"),
+                "published_at": article.get("publishedAt"),
+                "source": article.get("source", {}).get("name", "News"),
+            }
+            for article in payload.get("articles", [])[:5]
+        ]
+
+    async def _fetch_hackernews_story(
+        self, session: aiohttp.ClientSession, story_id: int
+    ) -> Dict[str, Any]:
+        return await self._get_json(
+            session,
+            f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json",
+            f"HackerNews item {story_id} fetch",
+        )
+
+    async def _fetch_hackernews(self, session: aiohttp.ClientSession) -> List[Dict[str, str]]:
+        top_ids = (
+            await self._get_json(
+                session, "https://hacker-news.firebaseio.com/v0/topstories.json", "HackerNews top stories fetch"
+            )
+        )[:5]
+        logger.debug("HackerNews top stories IDs: %s", top_ids)
+        # Item lookups are independent, so fetch them concurrently
+        stories = await asyncio.gather(
+            *(self._fetch_hackernews_story(session, story_id) for story_id in top_ids),
+            return_exceptions=True,
+        )
+        items: List[Dict[str, str]] = []
+        for story_id, story in zip(top_ids, stories):
+            if isinstance(story, BaseException) or not story:
+                logger.warning("HackerNews item %s fetch failed: %s", story_id, story)
+                continue
+            items.append(
+                {
+                    "title": story.get("title", ""),
+                    "description": story.get("title", ""),
+                    "url": story.get("url") or f"https://news.ycombinator.com/item?id={story_id}",
+                    "published_at": datetime.utcfromtimestamp(story.get("time", 0)).isoformat(),
+                    "source": "HackerNews",
+                }
+            )
+        return items
+
     # ------------------------------------------------------------------
     # AI helpers
     # ------------------------------------------------------------------
@@ -287,102 +973,47 @@ class TwitterNewsBot:
 
     def _get_font(self, font_name: str, size: int, bold: bool = False) -> Optional[ImageFont.FreeTypeFont]:
         """Try to load a font, fallback to default if not found."""
-        font_paths = {
-            "Inter": [
-                "/System/Library/Fonts/Supplemental/Arial.ttf",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            ],
-            "Montserrat": [
-                "/System/Library/Fonts/Supplemental/Arial.ttf",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            ],
-            "Roboto": [
-                "/System/Library/Fonts/Supplemental/Arial.ttf",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            ],
-            "HelveticaNeue": [
-                "/System/Library/Fonts/Helvetica.ttc",
-                "/System/Library/Fonts/Supplemental/Arial.ttf",
-            ],
-        }
-        
-        paths = font_paths.get(font_name, font_paths["Inter"])
-        if bold:
-            paths = [p.replace(".ttf", "-Bold.ttf").replace(".ttc", "-Bold.ttc") for p in paths] + paths
-        
-        for path in paths:
-            if Path(path).exists():
-                try:
-                    return ImageFont.truetype(path, size)
-                except Exception:
-                    continue
-        
-        # Try locating font via fontconfig, common on Linux containers
-        def _load_with_fontconfig(family: str) -> Optional[ImageFont.FreeTypeFont]:
-            pattern = family
-            if bold:
-                pattern = f"{family}:style=Bold"
-            try:
-                result = subprocess.run(
-                    ["fc-match", "-f", "%{file}\n", pattern],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                font_path = result.stdout.strip()
-                if font_path and Path(font_path).exists():
-                    logger.debug("Loaded font via fontconfig: %s (%s)", font_path, pattern)
-                    return ImageFont.truetype(font_path, size)
-            except Exception as exc:
-                logger.debug("fontconfig lookup failed for %s: %s", pattern, exc)
-            return None
-
-        fontconfig_families = {
-            "Inter": "Inter",
-            "Montserrat": "Montserrat",
-            "Roboto": "Roboto",
-            "HelveticaNeue": "Helvetica Neue",
-        }
-        fc_family = fontconfig_families.get(font_name)
-        if fc_family:
-            font = _load_with_fontconfig(fc_family)
-            if font:
-                return font
-        # Try generic fallbacks
-        for generic in ["DejaVu Sans", "Arial", "Liberation Sans"]:
-            font = _load_with_fontconfig(generic)
-            if font:
-                return font
-
-        # Fallback to default font
-        try:
-            return ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", size)
-        except Exception:
-            return ImageFont.load_default()
+        return _load_font(font_name, size, bold)
 
     def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
         """Wrap text to fit within max_width pixels."""
         words = text.split()
         lines = []
         current_line = []
-        
+        current_width = 0.0
+        # Measure each word once and accumulate advance widths instead of
+        # re-measuring the whole candidate line for every word.
+        space_width = font.getlength(" ")
+
         for word in words:
-            test_line = " ".join(current_line + [word])
-            bbox = font.getbbox(test_line)
-            width = bbox[2] - bbox[0]
-            
+            word_width = font.getlength(word)
+            width = current_width + space_width + word_width if current_line else word_width
+
             if width <= max_width:
                 current_line.append(word)
+                current_width = width
             else:
                 if current_line:
                     lines.append(" ".join(current_line))
                 current_line = [word]
+                current_width = word_width
         
         if current_line:
             lines.append(" ".join(current_line))
         
         return lines if lines else [text]
 
+    def _line_height(self, font: ImageFont.FreeTypeFont, text: str) -> int:
+        """Rendered height of a single line of text."""
+        bbox = font.getbbox(text)
+        return bbox[3] - bbox[1]
+
+    def _block_height(
+        self, draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont, spacing: int
+    ) -> int:
+        """Height of a multiline text block drawn at the origin."""
+        return draw.multiline_textbbox((0, 0), text, font=font, spacing=spacing)[3]
+
     def _draw_bitcoin_logo(self, draw: ImageDraw.Draw, x: int, y: int, size: int):
         """Draw a simple Bitcoin logo (B symbol with lines)."""
         # Draw circular background (light beige/off-white)
@@ -417,39 +1048,21 @@ class TwitterNewsBot:
 
     def _extract_hashtags(self, headline: str, key_points: List[str]) -> str:
         """Extract relevant hashtags from content."""
-        hashtags = []
         text = f"{headline} {' '.join(key_points)}".upper()
         
-        # Common crypto hashtags
-        crypto_keywords = {
-            "BITCOIN": "#Bitcoin", "BTC": "#Bitcoin",
-            "ETHEREUM": "#Ethereum", "ETH": "#Ethereum",
-            "SOLANA": "#Solana", "SOL": "#Solana",
-            "ZCASH": "#Zcash", "ZEC": "#Zcash",
-            "FIRO": "#Firo",
-            "MONERO": "#Monero", "XMR": "#Monero",
-            "NEAR": "#NEAR", "NEAR PROTOCOL": "#NEAR",
-            "UNISWAP": "#Uniswap", "UNI": "#Uniswap",
-            "NFT": "#NFTs", "NFTs": "#NFTs", "PENGUIN": "#NFTs",
-            "WEB3": "#Web3",
-        }
-        
-        # Check for crypto keywords
-        for keyword, hashtag in crypto_keywords.items():
-            if keyword in text and hashtag not in hashtags:
-                hashtags.append(hashtag)
+        # Single pass over the text for all crypto keywords, keeping the
+        # order in which the hashtags first appear
+        hashtags = list(
+            dict.fromkeys(self.CRYPTO_KEYWORDS[match.group(1)] for match in self._KEYWORD_RE.finditer(text))
+        )
         
         # Add default hashtags if none found
         if not hashtags:
             hashtags = ["#Crypto", "#Tech", "#News"]
         elif len(hashtags) < 3:
-            # Add Web3 or NFTs if relevant
-            if "NFT" in text or "PENGUIN" in text:
-                if "#NFTs" not in hashtags:
-                    hashtags.append("#NFTs")
-            if "WEB3" in text or "BLOCKCHAIN" in text:
-                if "#Web3" not in hashtags:
-                    hashtags.append("#Web3")
+            # Add Web3 if relevant
+            if "BLOCKCHAIN" in text and "#Web3" not in hashtags:
+                hashtags.append("#Web3")
             # Fill remaining slots
             defaults = ["#Crypto", "#Tech", "#News"]
             for default in defaults:
@@ -458,6 +1071,74 @@ class TwitterNewsBot:
         
         return " ".join(hashtags[:3])  # Max 3 hashtags
 
+    def _load_background(self, width: int, height: int) -> Image.Image:
+        """Load the placeholder background, falling back to a solid colour."""
+        # Check environment variable, config, or default to template.png in bot directory
+        placeholder_path = (
+            os.getenv("PLACEHOLDER_IMAGE_PATH")
+            or self.config.get("placeholder_image_path")
+            or str(Path(__file__).parent / "template.png")
+        )
+
+        if placeholder_path and os.path.exists(placeholder_path):
+            try:
+                cache_key = (placeholder_path, (width, height))
+                mtime = os.path.getmtime(placeholder_path)
+                cached = _BACKGROUND_CACHE.get(cache_key)
+                if cached and cached[0] == mtime:
+                    return cached[1]
+
+                # A pre-resized copy next to the template turns the resize
+                # into a plain PNG decode for new worker processes
+                source_path = Path(placeholder_path)
+                resized_path = source_path.with_name(f"{source_path.stem}_{width}x{height}.png")
+                try:
+                    resized_fresh = os.stat(resized_path).st_mtime >= mtime
+                except FileNotFoundError:
+                    resized_fresh = False
+                if resized_fresh:
+                    logger.debug("Loading pre-resized placeholder image from: %s", resized_path)
+                    with Image.open(resized_path) as cached_image:
+                        img = cached_image.convert("RGB")
+                    _BACKGROUND_CACHE[cache_key] = (mtime, img)
+                    return img
+
+                logger.debug("Loading placeholder image from: %s", placeholder_path)
+                with Image.open(placeholder_path) as source:
+                    # Convert to RGB if necessary (handles RGBA, P, etc.)
+                    img = source.convert("RGB") if source.mode != "RGB" else source
+                    # Resize to match canvas dimensions (1200x675). BILINEAR is
+                    # indistinguishable from LANCZOS for small scale changes and
+                    # several times cheaper.
+                    src_width, src_height = img.size
+                    if abs(src_width - width) < 200 and abs(src_height - height) < 150:
+                        resample = Image.Resampling.BILINEAR
+                    else:
+                        resample = Image.Resampling.LANCZOS
+                    img = img.resize((width, height), resample)
+                _BACKGROUND_CACHE[cache_key] = (mtime, img)
+                logger.debug("Placeholder image loaded and resized successfully")
+                self._save_resized_template(img, resized_path)
+                return img
+            except Exception as exc:
+                logger.warning("Failed to load placeholder image, using solid color background: %s", exc)
+
+        # Fallback to solid color background if placeholder not available
+        return Image.new("RGB", (width, height), color=(30, 30, 30))  # Dark grey/black
+
+    def _save_resized_template(self, img: Image.Image, resized_path: Path) -> None:
+        """Persist a resized template; failures only cost a resize next time."""
+        # Write to a temporary name first so concurrent workers never read a
+        # partially written file
+        partial_path = resized_path.with_name(f"{resized_path.stem}.{os.getpid()}.tmp")
+        try:
+            img.save(str(partial_path), "PNG", compress_level=1)
+            os.replace(partial_path, resized_path)
+            logger.debug("Cached resized placeholder image at %s", resized_path)
+        except Exception as exc:
+            logger.debug("Could not cache resized placeholder image: %s", exc)
+            partial_path.unlink(missing_ok=True)
+
     def generate_ai_image(self, headline: str, key_points: List[str]) -> Optional[str]:
         """Generate news card with text overlay using Pillow - matching image 2 style."""
         logger.debug("Generating text overlay image with headline: %s", headline)
@@ -478,38 +1159,15 @@ class TwitterNewsBot:
         
         # Try multiple font variations
         font_variations = ["Inter", "Montserrat", "Roboto", "HelveticaNeue"]
-        temp_dir = Path(tempfile.gettempdir()) / "twitter_bot"
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = time.time_ns()
+        
+        # The background only depends on the template, so load it once and
+        # copy it for each font attempt.
+        background = self._load_background(width, height)
         
         for font_name in font_variations:
             try:
-                # Load placeholder background image if available, otherwise use solid color
-                # Check environment variable, config, or default to template.png in bot directory
-                placeholder_path = (
-                    os.getenv("PLACEHOLDER_IMAGE_PATH") 
-                    or self.config.get("placeholder_image_path")
-                    or str(Path(__file__).parent / "template.png")
-                )
-                img = None
-                
-                if placeholder_path and os.path.exists(placeholder_path):
-                    try:
-                        logger.debug("Loading placeholder image from: %s", placeholder_path)
-                        img = Image.open(placeholder_path)
-                        # Convert to RGB if necessary (handles RGBA, P, etc.)
-                        if img.mode != "RGB":
-                            img = img.convert("RGB")
-                        # Resize to match canvas dimensions (1200x675)
-                        img = img.resize((width, height), Image.LANCZOS)
-                        logger.debug("Placeholder image loaded and resized successfully")
-                    except Exception as exc:
-                        logger.warning("Failed to load placeholder image, using solid color background: %s", exc)
-                        img = None
-                
-                # Fallback to solid color background if placeholder not available
-                if img is None:
-                    img = Image.new("RGB", (width, height), color=(30, 30, 30))  # Dark grey/black
-                
+                img = background.copy()
                 draw = ImageDraw.Draw(img)
                 
                 # Font sizes (larger for headline and bullet points)
@@ -530,61 +1188,56 @@ class TwitterNewsBot:
                 
                 # Footer text
                 footer_text = "Powered by 0xQuant Agent"
-                footer_height = footer_font.getbbox(footer_text)[3] - footer_font.getbbox(footer_text)[1]
+                footer_height = self._line_height(footer_font, footer_text)
                 
                 # Draw headline (top) - allow multiple lines
-                headline_lines = self._wrap_text(formatted_headline, headline_font, content_width)
-                y_position = padding_y
-                
-                for line in headline_lines:
-                    bbox = headline_font.getbbox(line)
-                    text_width = bbox[2] - bbox[0]
-                    x_position = padding_x  # Left align
-                    draw.text((x_position, y_position), line, font=headline_font, fill=text_color)
-                    y_position += bbox[3] - bbox[1] + 8  # Tighter spacing
+                headline_text = "\n".join(self._wrap_text(formatted_headline, headline_font, content_width))
+                # Left align, tighter spacing
+                draw.multiline_text(
+                    (padding_x, padding_y), headline_text, font=headline_font, fill=text_color, spacing=8
+                )
+                y_position = padding_y + self._block_height(draw, headline_text, headline_font, 8) + 8
                 
                 # Draw bullet points (middle section)
                 y_position += 30  # Space after headline
                 bullet_start_y = y_position
                 
                 # Calculate available space for bullet points (leave room for hashtags and footer at bottom)
-                hashtag_height = hashtag_font.getbbox(hashtags)[3] - hashtag_font.getbbox(hashtags)[1]
+                hashtag_height = self._line_height(hashtag_font, hashtags)
                 available_height = height - y_position - padding_y - hashtag_height - footer_height - 30  # 30px buffer for spacing
                 
-                # Fit as many bullet points as possible
-                fitted_points = []
-                current_height = 0
+                # Fit as many bullet points as possible. Each point is wrapped
+                # once and the wrapped lines are reused for drawing.
+                wrapped_points = [
+                    "\n".join(self._wrap_text(point, bullet_font, content_width)) for point in bullet_points
+                ]
+                block_heights = [self._block_height(draw, point_text, bullet_font, 12) for point_text in wrapped_points]
+                point_heights = [
+                    block_height + 12 + 8  # Add spacing between points
+                    for block_height in block_heights
+                ]
+                # Heights are positive, so the prefix sums are sorted and the
+                # number of points that fit is a binary search away
+                cumulative_heights = list(itertools.accumulate(point_heights))
+                fit_count = bisect.bisect_right(cumulative_heights, available_height)
+                fitted_points = list(zip(wrapped_points, block_heights))[:fit_count]
+                current_height = cumulative_heights[fit_count - 1] if fit_count else 0
                 
-                for point in bullet_points:
-                    point_lines = self._wrap_text(point, bullet_font, content_width)
-                    point_height = sum(
-                        (bullet_font.getbbox(line)[3] - bullet_font.getbbox(line)[1] + 12)
-                        for line in point_lines
-                    ) + 8  # Add spacing between points
-                    
-                    if current_height + point_height <= available_height:
-                        fitted_points.append(point)
-                        current_height += point_height
-                    else:
-                        # Try to fit at least part of the point if we have some space
-                        if current_height < available_height - 50:  # At least 50px available
-                            # Try to fit first line of this point
-                            first_line = point_lines[0] if point_lines else point[:50]
-                            first_line_height = bullet_font.getbbox(first_line)[3] - bullet_font.getbbox(first_line)[1] + 12
-                            if current_height + first_line_height <= available_height:
-                                fitted_points.append(first_line + "...")
-                        break
+                # Try to fit at least part of the next point if we have some space
+                if fit_count < len(bullet_points) and current_height < available_height - 50:  # At least 50px available
+                    # Try to fit first line of this point
+                    first_line = wrapped_points[fit_count].split("\n", 1)[0] or bullet_points[fit_count][:50]
+                    first_line_height = self._line_height(bullet_font, first_line) + 12
+                    if current_height + first_line_height <= available_height:
+                        partial_text = "\n".join(self._wrap_text(first_line + "...", bullet_font, content_width))
+                        fitted_points.append((partial_text, self._block_height(draw, partial_text, bullet_font, 12)))
                 
-                # Draw fitted bullet points
-                for i, point in enumerate(fitted_points):
-                    # Wrap bullet point text
-                    point_lines = self._wrap_text(point, bullet_font, content_width)
-                    
-                    for j, line in enumerate(point_lines):
-                        x_position = padding_x
-                        bbox = bullet_font.getbbox(line)
-                        draw.text((x_position, y_position), line, font=bullet_font, fill=text_color)
-                        y_position += bbox[3] - bbox[1] + 12
+                # Draw fitted bullet points, one multiline block per point
+                for i, (point_text, block_height) in enumerate(fitted_points):
+                    draw.multiline_text(
+                        (padding_x, y_position), point_text, font=bullet_font, fill=text_color, spacing=12
+                    )
+                    y_position += block_height + 12
                     
                     # Add spacing between bullet points
                     if i < len(fitted_points) - 1:
@@ -613,8 +1266,10 @@ class TwitterNewsBot:
                 draw.text((footer_x, footer_y), footer_text, font=footer_font, fill=footer_color)
                 
                 # Save image
-                image_path = temp_dir / f"news_overlay_{font_name.lower()}_{int(datetime.utcnow().timestamp())}.png"
-                img.save(str(image_path), "PNG", optimize=True)
+                # The card is opaque, so a plain JPEG encode is far cheaper than
+                # an optimized PNG and keeps the upload small
+                image_path = self._tmpdir / f"news_overlay_{font_name.lower()}_{timestamp}.jpg"
+                img.save(str(image_path), "JPEG", quality=88, optimize=False, progressive=False)
                 logger.debug("Text overlay image saved: %s (font: %s)", image_path, font_name)
                 
                 # Return first successful variation
@@ -627,60 +1282,70 @@ class TwitterNewsBot:
         logger.error("Failed to generate text overlay image with any font variation")
         return None
 
-    async def _capture_screenshot(
-        self, url: str, selector: Optional[str], width: int, height: int
-    ) -> Optional[str]:
-        logger.debug("Launching headless browser for screenshot: url=%s selector=%s", url, selector)
-        if launch is None:
-            logger.warning("pyppeteer is not installed; skipping screenshot generation")
-            return None
-
-        executable_path = (
-            os.environ.get("CHROMIUM_PATH")
-            or shutil.which("chromium")
-            or shutil.which("chromium-browser")
-            or shutil.which("google-chrome")
-            or shutil.which("google-chrome-stable")
-        )
-
-        if not executable_path:
-            logger.error(
-                "Chromium executable not found. Set CHROMIUM_PATH environment variable "
-                "or ensure chromium is available on PATH."
+    async def generate_ai_image_async(self, headline: str, key_points: List[str]) -> Optional[str]:
+        """Return the news card for a summary, rendering it only when not cached."""
+        key = (headline, tuple(key_points))
+        cached = self._ai_image_cache.get(key)
+        if cached and os.path.exists(cached):
+            self._ai_image_cache.move_to_end(key)
+            logger.debug("Reusing rendered news card %s", cached)
+            return cached
+
+        image_path = await self._render_ai_image(headline, key_points)
+        if image_path:
+            self._ai_image_cache[key] = image_path
+            self._ai_image_cache.move_to_end(key)
+            while len(self._ai_image_cache) > self.AI_IMAGE_CACHE_SIZE:
+                _, evicted = self._ai_image_cache.popitem(last=False)
+                Path(evicted).unlink(missing_ok=True)
+        return image_path
+
+    async def _render_ai_image(self, headline: str, key_points: List[str]) -> Optional[str]:
+        """Render the news card in the image process pool."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                _get_image_pool(), self.generate_ai_image, headline, key_points
             )
-            return None
+        except concurrent.futures.BrokenExecutor as exc:
+            global _IMAGE_POOL
+            logger.warning("Image process pool unavailable, rendering in a thread: %s", exc)
+            _IMAGE_POOL = None
+            return await asyncio.to_thread(self.generate_ai_image, headline, key_points)
+
+    async def _wait_for_paint(self, page: Any) -> None:
+        """Wait until the document has loaded and two frames have been painted."""
+        try:
+            await page.waitForFunction("() => document.readyState === 'complete'", {"timeout": 5000})
+            await page.evaluate(
+                "() => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)))"
+            )
+        except Exception as exc:
+            logger.debug("Paint wait did not complete: %s", exc)
 
-        logger.debug("Using Chromium executable at: %s", executable_path)
-
-        browser = await launch(
-            headless=True,
-            args=[
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--window-size=1200,800",
-            ],
-            handleSIGINT=False,
-            handleSIGTERM=False,
-            handleSIGHUP=False,
-            executablePath=executable_path,
-        )
+    async def _capture_screenshot(
+        self, url: str, selector: Optional[str], width: int, height: int, target: str
+    ) -> Optional[str]:
+        logger.debug("Capturing screenshot: url=%s selector=%s", url, selector)
+        blocked_types = _BLOCKED_RESOURCE_TYPES
+        if target != "crypto-chart":
+            # Charts may draw from image tiles; other targets only need layout
+            blocked_types = blocked_types | {"image"}
+
+        page = None
+        reusable = False
         try:
-            page = await browser.newPage()
-            await page.setViewport({"width": width, "height": height, "deviceScaleFactor": 2})
-            
-            # Set user agent to avoid bot detection
-            await page.setUserAgent(
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            # Articles are captured for their static HTML/CSS only
+            page = await _BROWSER_POOL.checkout_page(
+                width, height, blocked_types, javascript=target != "news-article"
             )
+            if page is None:
+                return None
             
             logger.debug("Navigating to %s", url)
-            await page.goto(url, {"waitUntil": "networkidle2", "timeout": 30000})
-            
-            # Wait for page to be fully loaded
-            await asyncio.sleep(3)
+            # Only the DOM is needed here; the selector and paint waits below
+            # cover the content, so trackers that never go idle cannot stall us
+            await page.goto(url, {"waitUntil": "domcontentloaded", "timeout": 10000})
             
             # If selector provided, wait for it to appear and be visible
             if selector:
@@ -690,7 +1355,7 @@ class TwitterNewsBot:
                 selector_found = False
                 for sel in selectors:
                     try:
-                        await page.waitForSelector(sel, {"timeout": 5000, "visible": True})
+                        await page.waitForSelector(sel, {"timeout": 4000, "visible": True})
                         logger.debug("Selector %s found and visible", sel)
                         selector = sel  # Use the first found selector
                         selector_found = True
@@ -700,14 +1365,14 @@ class TwitterNewsBot:
                         continue
                 
                 if selector_found:
-                    # Additional wait for dynamic content (charts, etc.)
-                    await asyncio.sleep(3)
+                    # Let dynamic content (charts, etc.) paint before capturing
+                    await self._wait_for_paint(page)
                 else:
                     logger.warning("None of the selectors found: %s, will try viewport screenshot", selectors)
 
-            temp_dir = Path(tempfile.gettempdir()) / "twitter_bot"
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            image_path = temp_dir / f"screenshot_{int(datetime.utcnow().timestamp())}.png"
+            image_path = self._tmpdir / f"screenshot_{time.time_ns()}.jpg"
+            # Pages are opaque, so JPEG loses nothing visible and uploads faster
+            shot_options = {"path": str(image_path), "type": "jpeg", "quality": 85}
 
             screenshot_taken = False
             if selector:
@@ -726,7 +1391,7 @@ class TwitterNewsBot:
                         if box and box.get("width", 0) > 0 and box.get("height", 0) > 0:
                             logger.debug("Capturing element screenshot for selector %s (size: %sx%s)", 
                                         selector, box.get("width"), box.get("height"))
-                            await element.screenshot({"path": str(image_path)})
+                            await element.screenshot(shot_options)
                             screenshot_taken = True
                         else:
                             logger.warning("Element %s has zero dimensions, falling back to viewport", selector)
@@ -737,115 +1402,147 @@ class TwitterNewsBot:
             
             if not screenshot_taken:
                 logger.debug("Capturing viewport screenshot")
-                await page.screenshot({"path": str(image_path), "fullPage": False})
+                await page.screenshot({**shot_options, "fullPage": False})
+            reusable = True
             
             # Verify screenshot was created and has content
-            if image_path.exists():
-                file_size = image_path.stat().st_size
-                logger.debug("Screenshot stored at %s (size: %s bytes)", image_path, file_size)
-                if file_size < 1000:  # Less than 1KB is likely empty/corrupt
-                    logger.error("Screenshot file is suspiciously small (%s bytes), may be empty", file_size)
-                    return None
-                return str(image_path)
-            else:
+            try:
+                file_size = os.stat(image_path).st_size
+            except FileNotFoundError:
                 logger.error("Screenshot file was not created at %s", image_path)
                 return None
+            logger.debug("Screenshot stored at %s (size: %s bytes)", image_path, file_size)
+            if file_size < 500:  # A blank JPEG is a few hundred bytes
+                logger.error("Screenshot file is suspiciously small (%s bytes), may be empty", file_size)
+                return None
+            return str(image_path)
                 
         except Exception as exc:  # pragma: no cover
             logger.error("Screenshot capture failed: %s", exc, exc_info=True)
             return None
         finally:
-            await browser.close()
-            logger.debug("Browser closed")
+            if page is not None:
+                await _BROWSER_POOL.checkin_page(page, width, height, reusable)
+
+    def _cached_chart(self, symbol: str) -> Optional[str]:
+        """Return the cached chart for ``symbol`` if it is still fresh."""
+        image_path = _chart_cache_path(symbol)
+        try:
+            if time.time() - os.stat(image_path).st_mtime < _CHART_TTL:
+                logger.debug("Using cached chart PNG %s", image_path)
+                return str(image_path)
+        except FileNotFoundError:
+            pass
+        return None
 
-    def _download_chart_image(self, symbol: str, days: int = 7) -> Optional[str]:
+    async def _download_chart_image(self, symbol: str, days: int = 7) -> Optional[str]:
         """Download chart image directly from CoinGecko API (no CAPTCHA)."""
+        cached = self._cached_chart(symbol)
+        if cached:
+            return cached
+
+        image_path = _chart_cache_path(symbol)
         try:
-            # Map symbol to CoinGecko ID
-            symbol_to_id = {
-                "BTC": "bitcoin",
-                "ETH": "ethereum",
-                "SOL": "solana",
-                "XRP": "ripple",
-                "ADA": "cardano",
-                "DOT": "polkadot",
-                "MATIC": "matic-network",
-                "LINK": "chainlink",
-                "UNI": "uniswap",
-                "AVAX": "avalanche-2",
-            }
-            coin_id = symbol_to_id.get(symbol.upper(), "bitcoin")
+            coin_id = _SYMBOL_TO_COINGECKO.get(symbol.upper(), "bitcoin")
             
             # Use CoinGecko's public chart image endpoint (returns PNG)
             # Format: https://www.coingecko.com/coins/{id}/sparkline.png
             chart_image_url = f"https://www.coingecko.com/coins/{coin_id}/sparkline.png"
             logger.debug("Downloading chart PNG from CoinGecko: %s", chart_image_url)
             
-            response = requests.get(chart_image_url, timeout=15, headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            headers = {
                 "Accept": "image/png,image/*,*/*;q=0.8",
                 "Referer": "https://www.coingecko.com/",
-            })
-            
-            if response.status_code == 200 and response.content and len(response.content) > 1000:
-                temp_dir = Path(tempfile.gettempdir()) / "twitter_bot"
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                image_path = temp_dir / f"chart_{symbol}_{int(datetime.utcnow().timestamp())}.png"
-                image_path.write_bytes(response.content)
-                logger.debug("Chart PNG downloaded to %s (%s bytes)", image_path, len(response.content))
-                return str(image_path)
-            else:
-                logger.warning("Chart image download failed: status %s, size %s", 
-                             response.status_code, len(response.content) if response.content else 0)
-                return None
+            }
+            session = await self._get_session()
+            # Stream into a private file so readers in any worker only ever see
+            # a complete chart once it is moved into place
+            fd, partial_name = tempfile.mkstemp(dir=self._tmpdir, prefix=f"{image_path.name}.", suffix=".part")
+            os.close(fd)
+            partial_path = Path(partial_name)
+
+            async def fetch() -> Tuple[int, int]:
+                async with session.get(
+                    chart_image_url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)
+                ) as response:
+                    if response.status in _RETRY_STATUSES:
+                        response.raise_for_status()
+                    if response.status != 200:
+                        return response.status, 0
+                    total = 0
+                    with partial_path.open("wb") as fh:
+                        async for chunk in response.content.iter_chunked(_CHART_CHUNK_SIZE):
+                            total += len(chunk)
+                            if total > _CHART_MAX_BYTES:
+                                raise OSError(f"chart image exceeds {_CHART_MAX_BYTES} bytes")
+                            fh.write(chunk)
+                    return response.status, total
+
+            try:
+                status, size = await _with_retries(fetch, "Chart image download")
+                if status == 200 and size > 1000:
+                    os.replace(partial_path, image_path)
+                    logger.debug("Chart PNG downloaded to %s (%s bytes)", image_path, size)
+                    return str(image_path)
+            finally:
+                partial_path.unlink(missing_ok=True)
+            logger.warning("Chart image download failed: status %s, size %s", status, size)
+            return None
         except Exception as exc:
             logger.error("Chart image download failed: %s", exc, exc_info=True)
             return None
 
-    def generate_screenshot(self, news_items: List[Dict[str, str]], target: str) -> Optional[str]:
+    @staticmethod
+    def _detect_symbol(texts: Iterable[str], pattern: "re.Pattern[str]", candidates: Tuple[str, ...]) -> str:
+        """Return the first non-default candidate mentioned in casefolded ``texts``.
+
+        ``candidates[0]`` is the default. Within one text the earliest
+        candidate in priority order wins; a text whose best hit is the
+        default does not stop the search.
+        """
+        rank = {candidate.casefold(): index for index, candidate in enumerate(candidates)}
+        for text in texts:
+            hits = pattern.findall(text)
+            if hits:
+                best = min(rank[hit] for hit in hits)
+                if best:
+                    return candidates[best]
+        return candidates[0]
+
+    async def generate_screenshot(self, news_items: List[Dict[str, str]], target: str) -> Optional[str]:
         logger.debug("Generating screenshot (target=%s)", target)
         
         target = target or "crypto-chart"
+        # Folded once here and shared by the chart and ticker lookups
+        texts = [f"{item['title']} {item['description']}".casefold() for item in news_items]
         if target == "crypto-chart":
-            symbol = "BTC"
-            for item in news_items:
-                combined = f"{item['title']} {item['description']}".upper()
-                for sym in self.CRYPTO_SYMBOLS:
-                    if sym in combined:
-                        symbol = sym
-                        break
-                if symbol != "BTC":
-                    break
-            
-            # Try direct chart image download first (no CAPTCHA)
-            logger.debug("Attempting direct chart image download for %s", symbol)
-            chart_image = self._download_chart_image(symbol)
-            if chart_image:
-                return chart_image
+            symbol = self._detect_symbol(texts, self._SYMBOL_RE, self.CRYPTO_SYMBOLS)
             
-            # Fallback to browser screenshot if direct download fails
-            logger.debug("Direct download failed, falling back to browser screenshot")
+            cached = self._cached_chart(symbol)
+            if cached:
+                return cached
             if launch is None:
-                logger.warning("pyppeteer not installed; screenshot disabled")
-                return None
+                return await self._download_chart_image(symbol)
             
             # Use a simpler chart service that's less likely to have CAPTCHA
             # Use CoinMarketCap or a public chart API
             url = f"https://coinmarketcap.com/currencies/{symbol.lower()}/"
             selector = ".cmc-chart-container, .price-chart-container, canvas"
             width, height = 1200, 600
-            logger.debug("Using CoinMarketCap chart for %s at %s", symbol, url)
+            # The direct download (no CAPTCHA) is preferred and usually quick, so
+            # the CoinMarketCap capture (and any Chromium launch) only starts if
+            # it fails or stalls
+            logger.debug("Downloading chart for %s, hedging with CoinMarketCap capture at %s", symbol, url)
+            return await _prefer_primary(
+                self._download_chart_image(symbol),
+                lambda: self._capture_with_timeout(url, selector, width, height, target),
+                "Direct chart download",
+                hedge_delay=_CHART_HEDGE_DELAY,
+                on_discard=self._release_media,
+            )
             
         elif target == "crypto-ticker":
-            symbol = "bitcoin"
-            for item in news_items:
-                combined = f"{item['title']} {item['description']}".lower()
-                for sym in self.COINGECKO_IDS:
-                    if sym in combined:
-                        symbol = sym
-                        break
-                if symbol != "bitcoin":
-                    break
+            symbol = self._detect_symbol(texts, self._COINGECKO_RE, self.COINGECKO_IDS)
             
             if launch is None:
                 logger.warning("pyppeteer not installed; screenshot disabled")
@@ -864,54 +1561,75 @@ class TwitterNewsBot:
             width, height = 1200, 800
 
         logger.debug("Screenshot configuration resolved: url=%s selector=%s", url, selector)
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop and loop.is_running():
-            return asyncio.run_coroutine_threadsafe(
-                self._capture_screenshot(url, selector, width, height), loop
-            ).result()
+        return await self._capture_with_timeout(url, selector, width, height, target)
 
-        return asyncio.run(self._capture_screenshot(url, selector, width, height))
+    async def _capture_with_timeout(
+        self, url: str, selector: Optional[str], width: int, height: int, target: str
+    ) -> Optional[str]:
+        try:
+            return await asyncio.wait_for(
+                self._capture_screenshot(url, selector, width, height, target), timeout=_SCREENSHOT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.error("Screenshot capture timed out after %ss: %s", _SCREENSHOT_TIMEOUT, url)
+            return None
 
     # ------------------------------------------------------------------
     # Upload / Twitter helpers
     # ------------------------------------------------------------------
-    def upload_to_uploadme(self, media_path: str) -> Optional[str]:
+    async def upload_to_uploadme_bytes(self, data: bytes, filename: str) -> Optional[str]:
         api_key = self.config.get("uploadme_api_key")
-        if not api_key or not Path(media_path).exists():
+        if not api_key:
             return None
         try:
-            with open(media_path, "rb") as file_handle:
-                data = {
-                    "key": api_key,
-                    "format": "json",
-                }
-                files = {"source": file_handle}
-                response = requests.post(
-                    "https://uploadme.me/api/1/upload", data=data, files=files, timeout=30
-                )
-            response.raise_for_status()
-            payload = response.json()
+            form = aiohttp.FormData()
+            form.add_field("key", api_key)
+            form.add_field("format", "json")
+            form.add_field("source", data, filename=filename)
+            session = await self._get_session()
+            async with session.post(
+                "https://uploadme.me/api/1/upload", data=form, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                response.raise_for_status()
+                payload = orjson.loads(await response.read())
             return payload.get("image", {}).get("url") or payload.get("URL")
         except Exception as exc:  # pragma: no cover
-            print("UploadMe upload failed:", exc)
+            logger.warning("UploadMe upload failed: %s", exc)
             return None
 
-    def post_tweet(self, text: str, media_path: Optional[str]) -> Dict[str, Any]:
+    def _release_media(self, media_path: str) -> None:
+        """Delete a generated media file once used, keeping cached media."""
+        directory, name = os.path.split(media_path)
+        if name.startswith("chart_") and directory == str(self._tmpdir):
+            return
+        if media_path in self._ai_image_cache.values():
+            return
+        try:
+            os.unlink(media_path)
+        except FileNotFoundError:
+            pass
+
+    async def post_tweet(self, text: str, media_path: Optional[str]) -> Dict[str, Any]:
         image_url: Optional[str] = None
         final_text = text
 
         logger.debug("Posting tweet (dry_run=%s) media_path=%s", False, media_path)
-        if media_path and Path(media_path).exists():
+        media_bytes: Optional[bytes] = None
+        if media_path:
+            # Read once; both the Twitter upload and the UploadMe fallback use it
+            try:
+                media_bytes = Path(media_path).read_bytes()
+            except OSError as exc:
+                logger.error("Could not read media %s; posting text only: %s", media_path, exc)
+        if media_path and media_bytes is not None:
             try:
-                media = self.twitter_api.media_upload(media_path)
-                response = self.twitter_client.create_tweet(
-                    text=text, media_ids=[media.media_id]
+                # tweepy is synchronous, so its calls run in worker threads
+                media = await asyncio.to_thread(
+                    self.twitter_api.media_upload, filename=media_path, file=io.BytesIO(media_bytes)
+                )
+                response = await asyncio.to_thread(
+                    self.twitter_client.create_tweet, text=text, media_ids=[media.media_id]
                 )
-                Path(media_path).unlink(missing_ok=True)
                 logger.info("Tweet posted with media: id=%s", response.data.get("id"))
                 return {
                     "success": True,
@@ -921,20 +1639,18 @@ class TwitterNewsBot:
                 }
             except Forbidden as exc:
                 logger.warning("Direct media upload failed, attempting UploadMe fallback: %s", exc)
-                image_url = self.upload_to_uploadme(media_path)
-                Path(media_path).unlink(missing_ok=True)
+                image_url = await self.upload_to_uploadme_bytes(media_bytes, os.path.basename(media_path))
                 if image_url:
-                    available = 280 - len(image_url) - 1
-                    if len(final_text) > available:
-                        final_text = final_text[: available - 3] + "..."
-                    final_text = f"{final_text}\n{image_url}"
+                    available = 280 - _TWEET_URL_LENGTH - 1
+                    final_text = f"{_truncate_tweet(final_text, available)}\n{image_url}"
                 else:
                     logger.error("UploadMe fallback failed; posting text only")
             except Exception as exc:  # pragma: no cover
                 logger.error("Media upload failed: %s", exc)
-                Path(media_path).unlink(missing_ok=True)
+            finally:
+                self._release_media(media_path)
 
-        response = self.twitter_client.create_tweet(text=final_text)
+        response = await asyncio.to_thread(self.twitter_client.create_tweet, text=final_text)
         logger.info("Tweet posted without media: id=%s", response.data.get("id"))
         return {
             "success": True,
@@ -949,18 +1665,23 @@ class TwitterNewsBot:
     def build_tweet_text(self, headline: str, key_points: List[str]) -> Tuple[str, str]:
         key_points = key_points[:3]
         headline = headline.strip()
-
-        full_format = "📰 " + headline + "\n\n" + "\n".join("▸ " + p for p in key_points) + "\n\n"
-        abbreviated = "📰 " + headline + "\n\n" + ("▸ " + key_points[0] if key_points else "") + "\n\n"
-        minimal = "📰 " + headline + "\n\n"
-
-        if len(full_format) <= 260:
-            return full_format.strip(), "full"
-        if len(abbreviated) <= 280:
-            return abbreviated.strip(), "abbreviated"
-        return minimal.strip(), "minimal"
-
-    def run(self, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        head = f"{self._PREFIX}{headline}\n\n"
+        head_len = _tweet_length(head)
+        bullet_len = _tweet_length(self._BULLET)
+        point_lens = [bullet_len + _tweet_length(p) for p in key_points]
+
+        # Size the candidates from their parts and build only the one returned
+        bullets_len = sum(point_lens) + max(0, len(key_points) - 1)
+        if head_len + bullets_len + 2 <= 260:
+            bullets = "\n".join(f"{self._BULLET}{p}" for p in key_points)
+            return f"{head}{bullets}\n\n".strip(), "full"
+        first_len = point_lens[0] if key_points else 0
+        if head_len + first_len + 2 <= 280:
+            first = f"{self._BULLET}{key_points[0]}" if key_points else ""
+            return f"{head}{first}\n\n".strip(), "abbreviated"
+        return head.strip(), "minimal"
+
+    async def run(self, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         opts = {
             "use_image": True,
             "image_generation_type": self.config.get("image_generation_type", "screenshot"),
@@ -974,17 +1695,22 @@ class TwitterNewsBot:
         if options:
             opts.update(options)
 
-        logger.debug("Runner options: %s", json.dumps(opts, indent=2))
-        news_items: List[Dict[str, str]] = []
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Runner options: %s", orjson.dumps(opts, option=orjson.OPT_INDENT_2).decode())
+        # The two feeds are independent, so fetch them concurrently
+        fetches = []
         if opts["crypto_news_enabled"]:
-            news_items.extend(self.fetch_crypto_news())
+            fetches.append(self.fetch_crypto_news())
         if opts["world_news_enabled"]:
-            news_items.extend(self.fetch_world_news())
+            fetches.append(self.fetch_world_news())
+        news_items: List[Dict[str, str]] = list(
+            itertools.chain.from_iterable(await asyncio.gather(*fetches))
+        )
         logger.debug("Total news items after fetch: %s", len(news_items))
         if not news_items:
             return {"success": False, "error": "No news items found"}
 
-        headline, key_points = self.summarize_news(news_items)
+        headline, key_points = await asyncio.to_thread(self.summarize_news, news_items)
         logger.debug("Headline after summary: %s", headline)
         logger.debug("Key points after summary: %s", key_points)
         tweet_text, format_used = self.build_tweet_text(headline, key_points)
@@ -995,25 +1721,31 @@ class TwitterNewsBot:
             # Check if OpenAI-only flag is set
             if opts.get("use_openai_image_only", False):
                 logger.debug("useOpenAIImageOnly flag is true - using OpenAI image generation only")
-                media_path = self.generate_ai_image(headline, key_points)
+                media_path = await self.generate_ai_image_async(headline, key_points)
             else:
                 gen_type = (opts.get("image_generation_type") or "ai").lower()
                 logger.debug("Preparing media: type=%s", gen_type)
                 if gen_type == "screenshot":
-                    media_path = self.generate_screenshot(news_items, opts.get("screenshot_target", "crypto-chart"))
+                    media_path = await self.generate_screenshot(news_items, opts.get("screenshot_target", "crypto-chart"))
                 elif gen_type == "both":
-                    media_path = self.generate_ai_image(headline, key_points)
-                    if not media_path:
-                        media_path = self.generate_screenshot(
+                    # The card is a local render, so the screenshot only starts
+                    # if it fails or is unusually slow
+                    media_path = await _prefer_primary(
+                        self.generate_ai_image_async(headline, key_points),
+                        lambda: self.generate_screenshot(
                             news_items, opts.get("screenshot_target", "crypto-chart")
-                        )
+                        ),
+                        "AI image generation",
+                        hedge_delay=_AI_IMAGE_HEDGE_DELAY,
+                        on_discard=self._release_media,
+                    )
                 else:
-                    media_path = self.generate_ai_image(headline, key_points)
+                    media_path = await self.generate_ai_image_async(headline, key_points)
 
         if opts.get("dry_run"):
             logger.info("Dry run complete; returning preview")
             if media_path:
-                Path(media_path).unlink(missing_ok=True)
+                self._release_media(media_path)
             return {
                 "success": True,
                 "dryRun": True,
@@ -1021,7 +1753,7 @@ class TwitterNewsBot:
                 "format": format_used,
             }
 
-        post_result = self.post_tweet(tweet_text, media_path)
+        post_result = await self.post_tweet(tweet_text, media_path)
         logger.info("Bot run complete; tweet id=%s", post_result.get("tweetId"))
         post_result.update({
             "headline": headline,
@@ -1035,7 +1767,7 @@ class TwitterNewsBot:
 # FastAPI service for Railway deployment
 # ----------------------------------------------------------------------
 
-app = FastAPI(title="Twitter News Bot", version="1.0.0")
+app = FastAPI(title="Twitter News Bot", version="1.0.0", default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -1043,6 +1775,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Bots keep API clients, an HTTP session and rendered cards warm, so they are
+# reused across requests with the same credentials (most recent last). Run
+# toggles are not part of the key: trigger_run passes them as run options.
+_BOT_CACHE_SIZE = 8
+_BOT_KEY_FIELDS = (*TwitterNewsBot.CREDENTIAL_KEYS, "openai_api_key", "news_api_key", "uploadme_api_key")
+_BOTS: "collections.OrderedDict[Tuple[Optional[str], ...], TwitterNewsBot]" = collections.OrderedDict()
+# Runs currently using each bot, so eviction never closes one mid-run
+_BOT_RUNS: "collections.Counter[TwitterNewsBot]" = collections.Counter()
+
+# Each run may drive Chromium and the image pool; cap how many overlap per worker
+_RUN_SEMAPHORE = asyncio.Semaphore(int(os.getenv("BOT_CONCURRENCY", "2")))
+
 
 class TwitterCredentials(BaseModel):
     twitter_api_key: Optional[str] = Field(None, alias="twitterApiKey")
@@ -1106,33 +1850,107 @@ def resolve_config(req: RunRequest) -> Dict[str, Any]:
     return config
 
 
+@contextlib.asynccontextmanager
+async def _checkout_bot(config: Dict[str, Any]) -> AsyncIterator[TwitterNewsBot]:
+    """Yield the cached bot for ``config``, creating it on first use.
+
+    A bot evicted from the cache while runs are still using it is only
+    closed once the last of those runs has finished.
+    """
+    key = tuple(config.get(field) for field in _BOT_KEY_FIELDS)
+    bot = _BOTS.get(key)
+    if bot is None:
+        bot = TwitterNewsBot(config)
+        _BOTS[key] = bot
+    _BOTS.move_to_end(key)
+    _BOT_RUNS[bot] += 1
+    try:
+        evicted = []
+        while len(_BOTS) > _BOT_CACHE_SIZE:
+            evicted.append(_BOTS.popitem(last=False)[1])
+        for stale in evicted:
+            if not _BOT_RUNS[stale]:
+                await stale.aclose()
+        yield bot
+    finally:
+        _BOT_RUNS[bot] -= 1
+        if not _BOT_RUNS[bot]:
+            del _BOT_RUNS[bot]
+            if _BOTS.get(key) is not bot:
+                await bot.aclose()
+
+
+@app.on_event("startup")
+def startup() -> None:
+    _bootstrap()
+    _purge_stale_media()
+
+
+@app.on_event("shutdown")
+def shutdown_image_pool() -> None:
+    global _IMAGE_POOL
+    if _IMAGE_POOL is not None:
+        _IMAGE_POOL.shutdown(wait=False, cancel_futures=True)
+        _IMAGE_POOL = None
+
+
+@app.on_event("shutdown")
+async def shutdown_browser_pool() -> None:
+    await _BROWSER_POOL.close()
+
+
+@app.on_event("shutdown")
+async def shutdown_bots() -> None:
+    while _BOTS:
+        _, bot = _BOTS.popitem()
+        await bot.aclose()
+
+
 @app.get("/health")
-def health_check() -> Dict[str, str]:
+async def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
 
 @app.post("/run", response_model=RunResponse)
-def trigger_run(req: RunRequest) -> RunResponse:
+async def trigger_run(req: RunRequest) -> RunResponse:
     config = resolve_config(req)
-    bot = TwitterNewsBot(config)
-    result = bot.run(
-        {
-            "use_image": req.useImage,
-            "dry_run": req.dryRun,
-            "image_generation_type": req.imageGenerationType,
-            "screenshot_target": req.screenshotTarget,
-            "use_openai_image_only": req.useOpenAIImageOnly,
-            "crypto_news_enabled": req.cryptoNewsEnabled,
-            "world_news_enabled": req.worldNewsEnabled,
-        }
-    )
+    async with _RUN_SEMAPHORE:
+        async with _checkout_bot(config) as bot:
+            result = await bot.run(
+                {
+                    "use_image": req.useImage,
+                    "dry_run": req.dryRun,
+                    "image_generation_type": req.imageGenerationType,
+                    "screenshot_target": req.screenshotTarget,
+                    "use_openai_image_only": req.useOpenAIImageOnly,
+                    "crypto_news_enabled": req.cryptoNewsEnabled,
+                    "world_news_enabled": req.worldNewsEnabled,
+                }
+            )
     return RunResponse(**result)
 
 
 def main() -> None:  # pragma: no cover - CLI helper
+    import importlib.util
+
     import uvicorn
 
-    uvicorn.run("bot:app", host="0.0.0.0", port=int(os.getenv("PORT", "8000")))
+    _bootstrap()
+    # uvicorn[standard] ships uvloop/httptools; fall back to the stdlib loop
+    # and h11 where they are unavailable (e.g. uvloop on Windows).
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    workers = int(os.getenv("WEB_CONCURRENCY", str(2 * (os.cpu_count() or 1) + 1)))
+    logger.debug("Starting uvicorn: loop=%s http=%s workers=%s", loop, http, workers)
+
+    uvicorn.run(
+        "bot:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop=loop,
+        http=http,
+        workers=workers,
+    )
 
 
 if __name__ == "__main__":  # pragma: no cover